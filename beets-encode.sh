@@ -20,6 +20,10 @@ ENCODED_DIR="${SCRIPT_DIR}/encoded"
 BITRATE="96k"
 BEETS_CONFIG="${SCRIPT_DIR}/config.yaml"
 
+# Encoded-file count and total size, set once after conversion and reused by later steps
+ENCODED_COUNT=0
+ENCODED_BYTES=0
+
 # Flags
 DRY_RUN=0
 VERBOSE=0
@@ -94,11 +98,19 @@ command_exists() {
 }
 
 count_files() {
-    find "$1" -type f \( -iname "*.mp3" -o -iname "*.m4a" -o -iname "*.flac" -o -iname "*.ogg" -o -iname "*.aac" \) 2>/dev/null | wc -l | tr -d ' '
+    # Prune system metadata directories so find never descends into them,
+    # rather than enumerating their contents and filtering per file.
+    # One case-insensitive extension match replaces five -iname alternations.
+    find -E "$1" \( -name ".Spotlight-V100" -o -name ".Trashes" -o -name "System Volume Information" \) -prune -o \
+        -type f -iregex '.*\.(mp3|m4a|flac|ogg|aac)' -print 2>/dev/null | wc -l | tr -d ' '
 }
 
-count_m4a_files() {
-    find "$1" -type f -name "*.m4a" 2>/dev/null | wc -l | tr -d ' '
+encoded_stats() {
+    # Set ENCODED_COUNT and ENCODED_BYTES from a single walk of the encoded dir
+    local stats
+    stats=$(find "$ENCODED_DIR" -type f -name "*.m4a" -exec stat -f %z {} + 2>/dev/null | awk '{n++; b+=$1} END {printf "%d %d", n, b}')
+    ENCODED_COUNT=${stats% *}
+    ENCODED_BYTES=${stats#* }
 }
 
 run_beets() {
@@ -217,30 +229,27 @@ convert_music() {
     
     if [[ $DRY_RUN -eq 1 ]]; then
         echo "  [DRY RUN] Would run: beet -c $BEETS_CONFIG convert -a"
+        encoded_stats
         return
     fi
-    
+
     echo "  This may take several minutes depending on library size..."
     run_beets convert -a
-    
-    local encoded_count
-    encoded_count=$(count_m4a_files "$ENCODED_DIR")
-    echo -e "${GREEN}✓${NC} Conversion complete ($encoded_count AAC files)"
+
+    encoded_stats
+    echo -e "${GREEN}✓${NC} Conversion complete ($ENCODED_COUNT AAC files)"
 }
 
 # Verify encoded files
 verify_encoded_files() {
     log_step "Verifying encoded files"
-    
-    local encoded_count
-    encoded_count=$(count_m4a_files "$ENCODED_DIR")
-    
-    if [[ $encoded_count -eq 0 ]]; then
+
+    if [[ $ENCODED_COUNT -eq 0 ]]; then
         log_error "No encoded files found in: $ENCODED_DIR"
         exit 1
     fi
-    
-    echo -e "${GREEN}✓${NC} Found $encoded_count encoded files ready for device"
+
+    echo -e "${GREEN}✓${NC} Found $ENCODED_COUNT encoded files ready for device"
 }
 
 # Main workflow
@@ -273,9 +282,7 @@ main() {
     echo "═══════════════════════════════════════════════════════════"
     echo -e "${GREEN}✓ Encoding complete!${NC}"
     echo "═══════════════════════════════════════════════════════════"
-    local encoded_count
-    encoded_count=$(count_m4a_files "$ENCODED_DIR")
-    echo "  Encoded files: $encoded_count AAC tracks in $ENCODED_DIR"
+    echo "  Encoded files: $ENCODED_COUNT AAC tracks ($((ENCODED_BYTES / 1048576)) MB) in $ENCODED_DIR"
     echo "  Source files: $SOURCE_DIR"
     echo ""
     echo "Next step: Run sync-device.sh to copy files to your device"
@@ -54,8 +54,12 @@ if [[ -z "$DEVICE_MOUNT" ]]; then
     exit 1
 fi
 
-# Check dependencies
-for cmd in fatsort diskutil rsync; do
+# Check dependencies (a dry run touches nothing, so only rsync is needed)
+required_cmds=(fatsort diskutil plutil rsync)
+if [[ $DRY_RUN -eq 1 ]]; then
+    required_cmds=(rsync)
+fi
+for cmd in "${required_cmds[@]}"; do
     if ! command -v "$cmd" >/dev/null 2>&1; then
         echo "Error: Missing required command: $cmd"
         echo "Install with: brew install fatsort"
@@ -81,10 +85,14 @@ if [[ ! -d "$DEVICE_MOUNT" ]]; then
     exit 1
 fi
 
-device_node=$(diskutil info "$DEVICE_MOUNT" | grep "Device Node:" | awk '{print $3}')
-if [[ -z "$device_node" ]]; then
-    echo "Error: Could not determine device node for: $DEVICE_MOUNT"
-    exit 1
+# The device node is only needed for the real unmount/fatsort/remount cycle
+device_node=""
+if [[ $DRY_RUN -eq 0 ]]; then
+    device_node=$(diskutil info -plist "$DEVICE_MOUNT" | plutil -extract DeviceNode raw -o - - 2>/dev/null)
+    if [[ -z "$device_node" ]]; then
+        echo "Error: Could not determine device node for: $DEVICE_MOUNT"
+        exit 1
+    fi
 fi
 
 # Copy files
@@ -106,7 +114,7 @@ if [[ $DRY_RUN -eq 1 ]]; then
     echo "[DRY RUN] Would unmount, fatsort, and remount device"
 else
     echo "Running fatsort (requires sudo)..."
-    raw_device="${device_node/\/dev\/disk/\/dev\/rdisk}"
+    raw_device="${device_node/#\/dev\/disk/\/dev\/rdisk}"
     
     diskutil unmount "$DEVICE_MOUNT" || {
         echo "Error: Failed to unmount device. Close Finder windows and try again."